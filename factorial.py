@@ -1,11 +1,18 @@
+# Lazily grown table of factorials: _table[i] == i!.
+_table = [1, 1]
+
+
 def factorial(n: int) -> int:
     """Calculate factorial of a non-negative integer n."""
     if n < 0:
         raise ValueError("Negative input not allowed")
-    result = 1
-    for i in range(2, n + 1):
-        result *= i
-    return result
+    if n >= len(_table):
+        # Extend from the last cached value instead of recomputing from 2.
+        result = _table[-1]
+        for i in range(len(_table), n + 1):
+            result *= i
+            _table.append(result)
+    return _table[n]
 
 if __name__ == "__main__":
     print(f"Factorial of 5 is {factorial(5)}")